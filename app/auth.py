@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Dict, Optional, Tuple
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 import os
 import logging
+import hashlib
+import threading
+import time
 from dotenv import load_dotenv
 
 from app.database import get_db
@@ -28,6 +31,10 @@ if not SECRET_KEY:
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# Build the signing key once instead of on every encode/decode
+_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
+
 # Password hashing
 pwd_context = CryptContext(
     schemes=["bcrypt"],
@@ -38,6 +45,14 @@ pwd_context = CryptContext(
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+# Verified token payloads, keyed by a digest of the token, so repeat
+# requests with the same token skip signature verification
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: Dict[bytes, Tuple[float, dict]] = {}
+# get_current_user runs in the threadpool, so cache updates take a lock
+_token_cache_lock = threading.Lock()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     try:
@@ -82,7 +97,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         else:
             expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
         return encoded_jwt
     except Exception as e:
         logger.error(f"Token creation error: {str(e)}")
@@ -91,7 +106,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
             detail="Error creating access token"
         )
 
-async def get_current_user(
+def decode_access_token(token: str) -> dict:
+    """Decode and verify a JWT access token, reusing recent results"""
+    cache_key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached and cached[0] > now:
+        # Hand out a copy so callers can't alter the cached payload
+        return dict(cached[1])
+
+    payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM], options=_DECODE_OPTIONS)
+    # Never keep a payload past the token's own expiry
+    expires_at = min(now + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", now))
+    with _token_cache_lock:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[cache_key] = (expires_at, payload)
+    return dict(payload)
+
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -102,7 +136,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import os
 from dotenv import load_dotenv
 from typing import Generator
@@ -8,6 +9,8 @@ import logging
 from tenacity import retry, stop_after_attempt, wait_exponential
 import contextlib
 
+from app.config import settings
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -17,10 +20,15 @@ load_dotenv()
 # Database configuration
 SQLALCHEMY_DATABASE_URL = "sqlite:///./resume.db"
 
-# Create engine with SQLite configuration
+# Create engine with SQLite configuration and a sized connection pool
+# (file-based SQLite would otherwise get NullPool and reconnect per checkout)
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT
 )
 
 # Create session factory
@@ -82,7 +90,8 @@ def init_db():
     Initialize database with proper error handling
     """
     try:
-        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
@@ -10,6 +10,7 @@ from app.routers.matching import router as matching_router
 from app.database import engine, Base, get_db, test_connection
 from app.cache import init_cache
 import logging
+import os
 from typing import Dict
 import time
 from fastapi_limiter import FastAPILimiter
@@ -26,7 +27,8 @@ logger = logging.getLogger(__name__)
 # Create database tables
 logger.info("Creating database tables...")
 try:
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
     logger.info("Database tables created successfully")
 except Exception as e:
     logger.error(f"Error creating database tables: {str(e)}")
@@ -76,7 +78,7 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)) -> Dict:
+def health_check(db: Session = Depends(get_db)) -> Dict:
     """
     Health check endpoint that verifies database connectivity
     """
@@ -112,3 +114,15 @@ async def shutdown_event():
     # Close database connections
     engine.dispose()
     logger.info("Database connections closed")
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # One worker per core; "auto" picks uvloop/httptools where uvicorn[standard]
+    # installs them and falls back to asyncio/h11 elsewhere (uvloop is POSIX-only)
+    uvicorn.run(
+        "app.main:app",
+        workers=os.cpu_count() or 1,
+        loop="auto",
+        http="auto"
+    )
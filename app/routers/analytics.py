@@ -21,7 +21,7 @@ router = APIRouter(
 )
 
 @router.get("/dashboard")
-async def get_dashboard(
+def get_dashboard(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -34,7 +34,7 @@ async def get_dashboard(
     return get_dashboard_analytics(db)
 
 @router.get("/jobs/{job_id}")
-async def get_job_analytics_endpoint(
+def get_job_analytics_endpoint(
     job_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -48,7 +48,7 @@ async def get_job_analytics_endpoint(
     return get_job_analytics(db, job_id)
 
 @router.get("/skills")
-async def get_skill_trends_endpoint(
+def get_skill_trends_endpoint(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -61,7 +61,7 @@ async def get_skill_trends_endpoint(
     return get_skill_trends(db)
 
 @router.get("/hiring")
-async def get_hiring_trends_endpoint(
+def get_hiring_trends_endpoint(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -74,7 +74,7 @@ async def get_hiring_trends_endpoint(
     return get_hiring_trends(db)
 
 @router.get("/departments")
-async def get_department_analytics_endpoint(
+def get_department_analytics_endpoint(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
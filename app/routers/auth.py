@@ -17,6 +17,7 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+from app.auth import decode_access_token
 from app.database import get_db
 from app.models import User
 from app.schemas import TokenData, Token, UserCreate, UserResponse, UserTokenData
@@ -116,7 +117,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
             detail="Could not create access token"
         )
 
-async def get_current_user(
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -127,7 +128,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
         email: str = payload.get("sub")
         if email is None:
             logger.warning("Token validation failed: No email in payload")
@@ -144,7 +145,7 @@ async def get_current_user(
     return user
 
 @router.post("/register", response_model=UserResponse)
-async def register_user(
+def register_user(
     request: Request,
     user: UserCreate,
     db: Session = Depends(get_db)
@@ -163,7 +164,7 @@ async def register_user(
         if db_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
+                detail={"code": "EMAIL_ALREADY_REGISTERED", "message": "Email already registered"}
             )
         
         # Create new user
@@ -191,7 +192,7 @@ async def register_user(
         )
 
 @router.post("/token", response_model=Token)
-async def login_for_access_token(
+def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -275,12 +276,12 @@ async def login_for_access_token(
         )
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_user)):
+def read_users_me(current_user: User = Depends(get_current_user)):
     """Get current user information"""
     return current_user
 
 @router.post("/deactivate")
-async def deactivate_account(
+def deactivate_account(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime
 import json
@@ -251,9 +251,10 @@ def get_job_evaluations(
             detail="Job not found"
         )
     
-    query = db.query(CandidateEvaluation).filter(
-        CandidateEvaluation.job_id == job_id
-    )
+    # Each evaluation is serialized with its resume; load them in one query
+    query = db.query(CandidateEvaluation).options(
+        joinedload(CandidateEvaluation.resume)
+    ).filter(CandidateEvaluation.job_id == job_id)
     
     if status:
         query = query.filter(CandidateEvaluation.status == status)
@@ -41,7 +41,7 @@ class EvaluationResponse(BaseModel):
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(RateLimiter(times=10, minutes=1))]
 )
-async def evaluate_candidate_match(
+def evaluate_candidate_match(
     job_id: int,
     resume_id: int,
     db: Session = Depends(get_db),
@@ -121,7 +121,7 @@ async def evaluate_candidate_match(
     response_model=List[EvaluationResponse],
     dependencies=[Depends(RateLimiter(times=20, minutes=1))]
 )
-async def get_job_evaluations(
+def get_job_evaluations(
     job_id: int,
     min_score: Optional[float] = Query(None, ge=0, le=100),
     max_score: Optional[float] = Query(None, ge=0, le=100),
@@ -157,7 +157,7 @@ async def get_job_evaluations(
     "/batch-evaluate/{job_id}",
     dependencies=[Depends(RateLimiter(times=5, minutes=1))]
 )
-async def batch_evaluate_resumes(
+def batch_evaluate_resumes(
     job_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -237,7 +237,7 @@ async def batch_evaluate_resumes(
         )
 
 @router.get("/match-resumes/{job_id}")
-async def match_resumes(
+def match_resumes(
     job_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime
 import re
@@ -95,7 +95,13 @@ def create_screening_result(
         CandidateEvaluation.job_id == screening.job_id
     ).first()
     if existing_screening:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Screening result already exists for this resume and job")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "DUPLICATE_SCREENING",
+                "message": "Screening result already exists for this resume and job"
+            }
+        )
 
     # Create new screening result with evaluation timing
     evaluation_start = datetime.utcnow()
@@ -186,8 +192,11 @@ def get_screening_results_by_job(
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
-    # Build query
-    query = db.query(CandidateEvaluation).filter(CandidateEvaluation.job_id == job_id)
+    # Build query; each result is serialized with its resume, so load them
+    # in the same query rather than one lazy load per evaluation
+    query = db.query(CandidateEvaluation).options(
+        joinedload(CandidateEvaluation.resume)
+    ).filter(CandidateEvaluation.job_id == job_id)
 
     # Apply filters
     if status:
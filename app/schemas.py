@@ -196,10 +196,19 @@ class CandidateEvaluationUpdate(BaseModel):
     comments: Optional[str] = None
     status: Optional[EvaluationStatus] = None
 
-class CandidateEvaluationResponse(CandidateEvaluationBase):
+class CandidateEvaluationResponse(BaseModel):
     id: int
-    created_at: datetime
-    updated_at: datetime
+    resume_id: int
+    job_id: int
+    admin_id: int
+    overall_score: float
+    skill_match: float
+    experience_match: float
+    matching_skills: List[str]
+    comments: Optional[str] = None
+    status: EvaluationStatus
+    evaluation_date: Optional[datetime] = None
+    last_updated: Optional[datetime] = None
     resume: ResumeResponse
 
     class Config:
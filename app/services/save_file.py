@@ -1,30 +1,64 @@
 import os
 from fastapi import HTTPException
-from datetime import datetime
-import uuid
+import io
+import secrets
+import shutil
+import time
 
-# Configuration
-UPLOAD_DIR = "uploads"
+from app.config import settings
+
+# Configuration; UPLOAD_DIR is looked up on each save so it can be redirected
+UPLOAD_DIR = settings.UPLOAD_DIR
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-ALLOWED_EXTENSIONS = {'.pdf', '.docx', '.txt'}
+MAX_NAME_ATTEMPTS = 3
+ALLOWED_EXTENSIONS = frozenset({'.pdf', '.docx', '.txt'})
+# Uploads above Starlette's 1MB spool limit are already on disk
+SENDFILE_MIN_SIZE = 1024 * 1024
+
+# Create upload directory once at import rather than on every upload
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+def _copy_to_fd(src, fd: int, size: int) -> None:
+    """
+    Copy an upload stream into an open file descriptor, using sendfile
+    for uploads large enough to have been spooled to disk
+    """
+    # Smaller uploads are held in memory, where fileno() would force them to disk
+    if size > SENDFILE_MIN_SIZE:
+        try:
+            src_fd = src.fileno()
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fd, src_fd, offset, size - offset)
+                if not sent:
+                    raise EOFError(
+                        f"upload ended after {offset} of {size} bytes"
+                    )
+                offset += sent
+            return
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # No usable descriptor, or sendfile can't write to a regular
+            # file on this platform; start over with a plain copy
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+
+    src.seek(0)
+    with os.fdopen(os.dup(fd), "wb") as out:
+        shutil.copyfileobj(src, out)
 
 def save_resume(file) -> str:
     """
     Save uploaded resume file and return the file path
     """
     try:
-        # Create upload directory if it doesn't exist
-        os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-        # Validate file size
-        file_size = 0
-        for chunk in file.file:
-            file_size += len(chunk)
-            if file_size > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail="File size exceeds 5MB limit"
-                )
+        # Validate file size without reading the upload
+        file.file.seek(0, os.SEEK_END)
+        file_size = file.file.tell()
+        if file_size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail="File size exceeds 5MB limit"
+            )
 
         # Validate file extension
         file_extension = os.path.splitext(file.filename)[1].lower()
@@ -34,16 +68,30 @@ def save_resume(file) -> str:
                 detail="Only PDF, DOCX, and TXT files are allowed"
             )
 
-        # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        filename = f"{timestamp}_{unique_id}{file_extension}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
+        # Generate unique filename; O_EXCL makes a name collision fail
+        # instead of silently overwriting, so retry with a fresh name
+        for _ in range(MAX_NAME_ATTEMPTS):
+            filename = f"{time.time_ns()}_{secrets.token_hex(4)}{file_extension}"
+            file_path = os.path.join(UPLOAD_DIR, filename)
+            try:
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                break
+            except FileExistsError:
+                continue
+        else:
+            raise HTTPException(
+                status_code=500,
+                detail="Error saving file: could not allocate a unique filename"
+            )
 
-        # Save file
-        with open(file_path, "wb") as buffer:
-            file.file.seek(0)  # Reset file pointer
-            buffer.write(file.file.read())
+        # Save file, removing the partial file if the copy fails
+        try:
+            _copy_to_fd(file.file, fd, file_size)
+        except Exception:
+            os.close(fd)
+            os.unlink(file_path)
+            raise
+        os.close(fd)
 
         return file_path
 
@@ -5,16 +5,22 @@ Create Date: 2024-03-19 10:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from app.models import UserRole
 
+# Use the enum values ('admin', 'hr', 'user') as labels so the server
+# default matches, and manage the type explicitly instead of letting
+# add_column try to create it again
+user_role = postgresql.ENUM(*[role.value for role in UserRole], name='userrole', create_type=False)
+
 def upgrade():
-    # Create UserRole enum type
-    user_role = sa.Enum(UserRole, name='userrole')
-    user_role.create(op.get_bind())
+    # Create UserRole enum type if a previous run hasn't already
+    user_role.create(op.get_bind(), checkfirst=True)
 
-    # Add role column with default value
+    # Add role column with a constant default; on PostgreSQL 11+ this is a
+    # metadata-only change and doesn't rewrite the users table
     op.add_column('users', 
-        sa.Column('role', user_role, nullable=False, server_default='user')
+        sa.Column('role', user_role, nullable=False, server_default=UserRole.USER.value)
     )
 
 def downgrade():
@@ -22,4 +28,4 @@ def downgrade():
     op.drop_column('users', 'role')
     
     # Drop UserRole enum type
-    sa.Enum(name='userrole').drop(op.get_bind()) 
\ No newline at end of file
+    user_role.drop(op.get_bind(), checkfirst=True)
@@ -1,13 +1,16 @@
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
+import httpx
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+from passlib.context import CryptContext
+import importlib
 import os
 import sys
 from pathlib import Path
-import uuid
+import itertools
+from contextlib import contextmanager
 from fastapi import Request, Response
 from fastapi_limiter.depends import RateLimiter
 from fastapi_limiter import FastAPILimiter
@@ -21,27 +24,79 @@ from app.main import app
 from app.database import Base, get_db
 from app.config import settings, Settings, get_settings
 from app.models import User, Job, Applicant, Resume, CandidateEvaluation
-from app.auth import get_password_hash
+from app.auth import create_access_token
+from app import auth
+# app.routers rebinds its submodule names to their APIRouter objects, so
+# fetch the module itself
+auth_router = importlib.import_module("app.routers.auth")
 
-# Configure pytest-asyncio to use "auto" mode
-def pytest_configure(config):
-    config.option.asyncio_mode = "auto"
-
-# Test database configuration
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Test database configuration: a named shared-cache in-memory database, held
+# open by a single StaticPool connection for the whole session. Each
+# pytest-xdist worker gets its own database name.
+TEST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = f"sqlite:///file:test_{TEST_WORKER}?mode=memory&cache=shared&uri=true"
 engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool
 )
 
-# Enable foreign key constraints in SQLite
+# Enable foreign key constraints in SQLite and hand transaction control to
+# SQLAlchemy so SAVEPOINTs work with pysqlite
 def _fk_pragma_on_connect(dbapi_con, con_record):
+    dbapi_con.isolation_level = None
+    # Keep temporary tables and indices off disk as well
+    dbapi_con.execute('pragma temp_store=MEMORY')
     dbapi_con.execute('pragma foreign_keys=ON')
 
+def _begin_on_transaction(conn):
+    conn.exec_driver_sql("BEGIN")
+
 event.listen(engine, 'connect', _fk_pragma_on_connect)
+event.listen(engine, 'begin', _begin_on_transaction)
+
+_suffix_counter = itertools.count()
+
+def _unique_suffix() -> str:
+    """Suffix for values that must be unique across the run; the pid keeps xdist workers apart"""
+    return f"{next(_suffix_counter)}-{os.getpid()}"
+
+# Each test's rows are rolled back, so the test user can keep a fixed email
+# and tokens for it can be minted once per session
+TEST_USER_EMAIL = "testuser@example.com"
+
+# Precomputed bcrypt hash of "testpassword" so fixtures don't pay for hashing.
+# It uses cost 4, and verify honours the cost stored in the hash, so logins
+# against the test user stay cheap too
+_TEST_USER_HASH = "$2b$04$gXadLPRqC4gJ9Tl/rKLnNOnqiArLIoXo7dw2E/Z0V9xVPpW.3Rv.a"
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    expire_on_commit=False
+)
+
+# Sample resume text for resume fixtures
+RESUME_CONTENT = """John Doe
+Software Engineer
+john.doe@example.com
+(123) 456-7890
+
+EDUCATION
+Bachelor of Science in Computer Science
+University of Technology
+2018 - 2022
+
+EXPERIENCE
+Software Engineer at Tech Corp
+2022 - Present
+- Developed and maintained web applications using Python and FastAPI
+- Implemented RESTful APIs and microservices architecture
+- Collaborated with cross-functional teams to deliver high-quality software
+
+SKILLS
+Python, FastAPI, SQL, Docker, AWS, Git, REST APIs, Microservices"""
 
 # Test Redis configuration
 TEST_REDIS_URL = "redis://localhost:6379/1"
@@ -71,18 +126,54 @@ class MockRateLimiter:
 def override_rate_limiter():
     return MockRateLimiter()
 
-def override_get_db():
-    """Override database dependency for testing"""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """Use the minimum bcrypt cost in tests; hashing strength isn't under test"""
+    fast_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth, "pwd_context", fast_context)
+        mp.setattr(auth_router, "pwd_context", fast_context)
+        yield
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_db():
+    """Create tables once for the whole test session"""
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+    yield
+    with engine.begin() as conn:
+        Base.metadata.drop_all(bind=conn)
+
+@pytest.fixture(scope="function")
+def fresh_schema(db_session):
+    """Rebuild all tables; opt in with @pytest.mark.usefixtures("fresh_schema") when a test needs DDL isolation.
+    The DDL runs inside the test's transaction (SQLite DDL is transactional), so it is rolled back with it"""
+    conn = db_session.connection()
+    Base.metadata.drop_all(bind=conn)
+    Base.metadata.create_all(bind=conn)
+    # Rows loaded before the rebuild are gone; drop them from the identity map
+    db_session.expunge_all()
+
+_TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
 
-def create_test_tables():
-    """Create all tables in the test database"""
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+@pytest.fixture(scope="function")
+def query_counter():
+    """Context manager collecting the statements run on the test database inside it,
+    excluding transaction control, for query-count regression checks"""
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+                statements.append(statement)
+
+        event.listen(engine, "after_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "after_cursor_execute", _record)
+    return _count
 
 @pytest.fixture(scope="session")
 def test_app():
@@ -93,40 +184,58 @@ def test_app():
     )
     
     # Override dependencies
-    app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_settings] = lambda: test_settings
     app.dependency_overrides[RateLimiter] = override_rate_limiter
     
     return app
 
-@pytest_asyncio.fixture(scope="function")
-async def event_loop():
-    """Create an event loop for each test case."""
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the session so the client is built once"""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     yield loop
     loop.close()
 
-@pytest.fixture(scope="function")
-def client(test_app):
-    return TestClient(test_app)
+@pytest_asyncio.fixture(scope="session")
+async def client(test_app):
+    """Create one in-process async HTTP client for the whole session"""
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 @pytest.fixture(autouse=True)
-def setup_db():
-    """Automatically create tables before each test"""
-    create_test_tables()
+def _route_db_to_test_session(test_app, db_session):
+    """Route requests through the test's session so they see its data and are rolled back with it"""
+    # Sync handlers run in the threadpool and the session isn't
+    # thread-safe, so concurrent requests take turns with it
+    db_lock = asyncio.Lock()
+
+    async def override_get_db():
+        async with db_lock:
+            yield db_session
+
+    test_app.dependency_overrides[get_db] = override_get_db
     yield
-    Base.metadata.drop_all(bind=engine)
+    test_app.dependency_overrides.pop(get_db, None)
 
 @pytest.fixture(scope="function")
 def db_session():
-    """Create a fresh database session for each test"""
+    """Create a database session wrapped in a transaction that is rolled back after each test"""
     connection = engine.connect()
     transaction = connection.begin()
     session = TestingSessionLocal(bind=connection)
-    
+    session.begin_nested()
+
+    # Commits inside the test only release the SAVEPOINT; open a new one so
+    # the outer transaction can still roll everything back
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, trans):
+        if trans.nested and not trans._parent.nested:
+            session.begin_nested()
+
     yield session
-    
+
     session.close()
     transaction.rollback()
     connection.close()
@@ -134,114 +243,173 @@ def db_session():
 @pytest.fixture(scope="function")
 def test_user(db_session):
     """Create a test user for each test"""
-    unique_id = str(uuid.uuid4())
+    # Fixtures only flush: the rows get their primary keys and are visible to
+    # requests sharing this session, and the test transaction discards them
     user = User(
-        email=f"test{unique_id}@example.com",
+        email=TEST_USER_EMAIL,
         name="Test User",
-        hashed_password=get_password_hash("testpassword"),
+        hashed_password=_TEST_USER_HASH,
         is_active=True,
         role="admin"
     )
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    db_session.flush()
     return user
 
+@pytest.fixture(scope="session")
+def unique_suffix():
+    """Callable returning a fresh suffix for unique emails and names"""
+    return _unique_suffix
+
+@pytest.fixture(scope="session")
+def valid_token():
+    """Access token for the test user, signed once per session"""
+    return create_access_token({"sub": TEST_USER_EMAIL})
+
+@pytest.fixture(scope="session")
+def auth_headers(valid_token):
+    """Bearer token headers for the test user, built once without a login round trip.
+    Tests using them must also request test_user so the user row exists."""
+    return {"Authorization": "Bearer " + valid_token}
+
 @pytest.fixture(scope="function")
-def test_job(db_session, test_user):
+def make_job(db_session, test_user):
+    """Factory for jobs owned by the test user; keyword arguments override the defaults"""
+    def _make_job(**overrides):
+        fields = {
+            "admin_id": test_user.id,
+            "title": "Test Job",
+            "description": "Test Description",
+            "requirements": ["Python", "FastAPI"],
+            "department": "Engineering",
+            "location": "Remote",
+            "salary_range": {"min": 50000, "max": 100000},
+            "job_type": "Full-time",
+            "experience_required": 3.0,
+            "skills_required": ["Python", "FastAPI", "SQL"],
+            "status": "Open"
+        }
+        fields.update(overrides)
+        job = Job(**fields)
+        db_session.add(job)
+        db_session.flush()
+        return job
+    return _make_job
+
+@pytest.fixture(scope="function")
+def test_job(make_job):
     """Create a test job for each test"""
-    job = Job(
-        admin_id=test_user.id,
-        title="Test Job",
-        description="Test Description",
-        requirements=["Python", "FastAPI"],
-        department="Engineering",
-        location="Remote",
-        salary_range={"min": 50000, "max": 100000},
-        job_type="Full-time",
-        experience_required=3.0,
-        skills_required=["Python", "FastAPI", "SQL"],
-        status="Open"
-    )
-    db_session.add(job)
-    db_session.commit()
-    db_session.refresh(job)
-    return job
+    return make_job()
 
 @pytest.fixture(scope="function")
-def test_applicant(db_session):
-    """Create a test applicant for each test"""
-    unique_id = str(uuid.uuid4())
-    applicant = Applicant(
-        name="Test Applicant",
-        email=f"applicant{unique_id}@example.com",
-        phone="1234567890",
-        skills=["Python", "FastAPI"],
-        total_experience=3.0
-    )
-    db_session.add(applicant)
-    db_session.commit()
-    db_session.refresh(applicant)
-    return applicant
+def seeded_jobs(db_session, test_user):
+    """Insert a small set of jobs for the search tests in one batch"""
+    common = {
+        "admin_id": test_user.id,
+        "salary_range": {"min": 50000, "max": 100000},
+        "job_type": "Full-time",
+        "status": "Open"
+    }
+    jobs = [
+        {
+            **common,
+            "title": "Python Developer",
+            "description": "Build backend services",
+            "requirements": ["Python", "Django"],
+            "department": "Engineering",
+            "location": "Remote",
+            "experience_required": 2.0,
+            "skills_required": ["Python", "Django"]
+        },
+        {
+            **common,
+            "title": "Marketing Manager",
+            "description": "Lead campaigns",
+            "requirements": ["SEO"],
+            "department": "Marketing",
+            "location": "New York",
+            "experience_required": 5.0,
+            "skills_required": ["SEO", "Content"]
+        }
+    ]
+    db_session.bulk_insert_mappings(Job, jobs)
+    db_session.flush()
+    return jobs
 
 @pytest.fixture(scope="function")
-def test_resume(db_session, test_applicant, test_job):
-    """Create a test resume for each test"""
-    resume = Resume(
-        applicant_id=test_applicant.id,
-        job_id=test_job.id,
-        raw_text="""John Doe
-Software Engineer
-john.doe@example.com
-(123) 456-7890
+def make_applicant(db_session):
+    """Factory for applicants with a unique email; keyword arguments override the defaults"""
+    def _make_applicant(**overrides):
+        fields = {
+            "name": "Test Applicant",
+            "email": f"applicant{_unique_suffix()}@example.com",
+            "phone": "1234567890",
+            "skills": ["Python", "FastAPI"],
+            "total_experience": 3.0
+        }
+        fields.update(overrides)
+        applicant = Applicant(**fields)
+        db_session.add(applicant)
+        db_session.flush()
+        return applicant
+    return _make_applicant
 
-EDUCATION
-Bachelor of Science in Computer Science
-University of Technology
-2018 - 2022
+@pytest.fixture(scope="function")
+def test_applicant(make_applicant):
+    """Create a test applicant for each test"""
+    return make_applicant()
 
-EXPERIENCE
-Software Engineer at Tech Corp
-2022 - Present
-- Developed and maintained web applications using Python and FastAPI
-- Implemented RESTful APIs and microservices architecture
-- Collaborated with cross-functional teams to deliver high-quality software
+@pytest.fixture(scope="function")
+def make_resume(db_session, make_applicant, test_job):
+    """Factory for resumes on the test job by a new applicant; keyword arguments override the defaults"""
+    def _make_resume(**overrides):
+        fields = {
+            "job_id": test_job.id,
+            "raw_text": RESUME_CONTENT,
+            "file_path": "test.pdf",
+            "file_type": "application/pdf",
+            "file_size": 1024,
+            "parsed_content": {
+                "name": "John Doe",
+                "email": "john.doe@example.com",
+                "education": [
+                    {
+                        "degree": "Bachelor of Science in Computer Science",
+                        "school": "University of Technology",
+                        "years": "2018 - 2022"
+                    }
+                ],
+                "experience": [
+                    {
+                        "title": "Software Engineer",
+                        "company": "Tech Corp",
+                        "duration": "2022 - Present",
+                        "description": [
+                            "Developed and maintained web applications using Python and FastAPI",
+                            "Implemented RESTful APIs and microservices architecture",
+                            "Collaborated with cross-functional teams to deliver high-quality software"
+                        ]
+                    }
+                ]
+            },
+            "extracted_skills": ["Python", "FastAPI", "SQL", "Docker", "AWS", "Git", "REST APIs", "Microservices"],
+            "total_experience": 2.0,
+            "education": [],
+            "work_experience": []
+        }
+        fields.update(overrides)
+        if "applicant_id" not in fields:
+            fields["applicant_id"] = make_applicant().id
+        resume = Resume(**fields)
+        db_session.add(resume)
+        db_session.flush()
+        return resume
+    return _make_resume
 
-SKILLS
-Python, FastAPI, SQL, Docker, AWS, Git, REST APIs, Microservices""",
-        file_path="test.pdf",
-        file_type="application/pdf",
-        file_size=1024,
-        parsed_content={
-            "name": "John Doe",
-            "email": "john.doe@example.com",
-            "education": [
-                {
-                    "degree": "Bachelor of Science in Computer Science",
-                    "school": "University of Technology",
-                    "years": "2018 - 2022"
-                }
-            ],
-            "experience": [
-                {
-                    "title": "Software Engineer",
-                    "company": "Tech Corp",
-                    "duration": "2022 - Present",
-                    "description": [
-                        "Developed and maintained web applications using Python and FastAPI",
-                        "Implemented RESTful APIs and microservices architecture",
-                        "Collaborated with cross-functional teams to deliver high-quality software"
-                    ]
-                }
-            ]
-        },
-        extracted_skills=["Python", "FastAPI", "SQL", "Docker", "AWS", "Git", "REST APIs", "Microservices"],
-        total_experience=2.0
-    )
-    db_session.add(resume)
-    db_session.commit()
-    db_session.refresh(resume)
-    return resume
+@pytest.fixture(scope="function")
+def test_resume(make_resume, test_applicant):
+    """Create a test resume for each test"""
+    return make_resume(applicant_id=test_applicant.id)
 
 @pytest.fixture(scope="function")
 def test_evaluation(db_session, test_resume, test_job, test_user):
@@ -257,8 +425,7 @@ def test_evaluation(db_session, test_resume, test_job, test_user):
         status="Pending"
     )
     db_session.add(evaluation)
-    db_session.commit()
-    db_session.refresh(evaluation)
+    db_session.flush()
     return evaluation
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
@@ -1,30 +1,54 @@
 import pytest
-from fastapi.testclient import TestClient
-import uuid
+import io
 import os
-import tempfile
+import asyncio
+from datetime import datetime
+from typing import List
+from pydantic import parse_obj_as
 from app.models import User, Job, Applicant, Resume, CandidateEvaluation
-from app.auth import get_password_hash
+from jose import jwt
+from app.auth import get_password_hash, SECRET_KEY, ALGORITHM
+from app.services import save_file
+from app.schemas import JobResponse, Token
 
-def test_health_check(client):
-    response = client.get("/health")
+# Uploaded from memory so the upload tests do no disk I/O of their own
+RESUME_PDF_BYTES = b"Test PDF content"
+
+NEW_JOB_DATA = {
+    "title": "New Job Position",
+    "description": "Job description",
+    "requirements": ["Python", "FastAPI"],
+    "department": "Engineering",
+    "location": "Remote",
+    "salary_range": {"min": 50000, "max": 100000},
+    "job_type": "Full-time",
+    "experience_required": 3.0,
+    "skills_required": ["Python", "FastAPI"],
+    "status": "Open"
+}
+
+@pytest.mark.asyncio
+async def test_health_check(client):
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert data["database"] == "connected"
     assert "response_time" in data
 
-def test_root_endpoint(client):
-    response = client.get("/")
+@pytest.mark.asyncio
+async def test_root_endpoint(client):
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "Welcome to Resume Web Backend API"
     assert data["version"] == "1.0.0"
     assert data["status"] == "running"
 
-def test_user_registration(client):
-    unique_id = str(uuid.uuid4())
-    response = client.post(
+@pytest.mark.asyncio
+async def test_user_registration(client, unique_suffix):
+    unique_id = unique_suffix()
+    response = await client.post(
         "/auth/register",
         json={
             "email": f"newuser{unique_id}@example.com",
@@ -39,147 +63,140 @@ def test_user_registration(client):
     assert data["name"] == "New User"
     assert "hashed_password" not in data
 
-def test_user_login(client, test_user):
-    response = client.post(
-        "/auth/token",
-        data={
-            "username": test_user.email,
-            "password": "testpassword"
+@pytest.mark.asyncio
+async def test_user_registration_duplicate_email(client, test_user):
+    response = await client.post(
+        "/auth/register",
+        json={
+            "email": test_user.email,
+            "password": "TestPassword123!",
+            "name": "Duplicate User"
         }
     )
-    assert response.status_code == 200
-    data = response.json()
-    assert "access_token" in data
-    assert "token_type" in data
-    assert data["token_type"] == "bearer"
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "EMAIL_ALREADY_REGISTERED"
 
-def test_protected_endpoint(client, test_user):
-    # Get token
-    response = client.post(
+@pytest.mark.asyncio
+async def test_user_login(client, test_user):
+    response = await client.post(
         "/auth/token",
         data={
             "username": test_user.email,
             "password": "testpassword"
         }
     )
-    token = response.json()["access_token"]
+    assert response.status_code == 200
+    token = Token.parse_obj(response.json())
+    assert token.token_type == "bearer"
 
-    # Access protected endpoint
-    response = client.get(
+@pytest.mark.asyncio
+async def test_protected_endpoint(client, test_user, auth_headers):
+    response = await client.get(
         "/auth/me",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=auth_headers
     )
     assert response.status_code == 200
     data = response.json()
     assert data["email"] == test_user.email
     assert data["name"] == test_user.name
 
-def test_job_creation(client, test_user):
-    # Get token
-    response = client.post(
-        "/auth/token",
-        data={
-            "username": test_user.email,
-            "password": "testpassword"
-        }
+@pytest.mark.asyncio
+async def test_protected_endpoint_rejects_token_without_expiry(client, test_user):
+    token = jwt.encode({"sub": test_user.email}, SECRET_KEY, algorithm=ALGORITHM)
+    response = await client.get(
+        "/auth/me",
+        headers={"Authorization": "Bearer " + token}
     )
-    token = response.json()["access_token"]
+    assert response.status_code == 401
 
+@pytest.mark.asyncio
+async def test_job_creation(client, test_user, auth_headers):
     # Create job
-    job_data = {
-        "title": "New Job Position",
-        "description": "Job description",
-        "requirements": ["Python", "FastAPI"],
-        "department": "Engineering",
-        "location": "Remote",
-        "salary_range": {"min": 50000, "max": 100000},
-        "job_type": "Full-time",
-        "experience_required": 3.0,
-        "skills_required": ["Python", "FastAPI"],
-        "status": "Open"
-    }
-    response = client.post(
+    response = await client.post(
         "/jobs/",
-        json=job_data,
-        headers={"Authorization": f"Bearer {token}"}
+        json=NEW_JOB_DATA,
+        headers=auth_headers
     )
     assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == job_data["title"]
-    assert data["department"] == job_data["department"]
-    assert "id" in data
+    job = JobResponse.parse_obj(response.json())
+    assert job.title == NEW_JOB_DATA["title"]
+    assert job.department == NEW_JOB_DATA["department"]
 
-def test_job_search(client, test_job):
-    response = client.get("/jobs/", params={
+@pytest.mark.asyncio
+async def test_job_search(client, seeded_jobs):
+    response = await client.get("/jobs/", params={
         "department": "Engineering",
         "location": "Remote",
         "skip": 0,
         "limit": 10
     })
     assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-    if data:  # If there are results
-        assert "title" in data[0]
-        assert "department" in data[0]
-        assert "location" in data[0]
-
-def test_resume_upload(client, test_user, test_job):
-    # Get token
-    response = client.post(
-        "/auth/token",
+    jobs = parse_obj_as(List[JobResponse], response.json())
+    assert [job.title for job in jobs] == ["Python Developer"]
+    assert jobs[0].department == "Engineering"
+    assert jobs[0].location == "Remote"
+
+@pytest.mark.asyncio
+async def test_resume_upload(client, auth_headers, test_job, tmp_path, monkeypatch, unique_suffix):
+    # Save into the test's own directory so nothing needs cleaning up
+    monkeypatch.setattr(save_file, "UPLOAD_DIR", str(tmp_path))
+    files = {
+        "file": ("resume.pdf", io.BytesIO(RESUME_PDF_BYTES), "application/pdf")
+    }
+    response = await client.post(
+        "/resumes/",
+        files=files,
         data={
-            "username": test_user.email,
-            "password": "testpassword"
-        }
+            "job_id": test_job.id,
+            "name": "Test Applicant",
+            "email": f"applicant{unique_suffix()}@example.com",
+            "phone": "1234567890"
+        },
+        headers=auth_headers
     )
-    token = response.json()["access_token"]
-
-    # Create a temporary test PDF file
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_pdf:
-        temp_pdf.write(b"Test PDF content")
-        temp_pdf_path = temp_pdf.name
-
-    try:
-        # Upload resume
-        with open(temp_pdf_path, "rb") as pdf_file:
-            files = {
-                "file": ("resume.pdf", pdf_file, "application/pdf")
-            }
-            response = client.post(
-                "/resumes/",
-                files=files,
-                data={
-                    "job_id": test_job.id,
-                    "name": "Test Applicant",
-                    "email": f"applicant{uuid.uuid4()}@example.com",
-                    "phone": "1234567890"
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-        assert response.status_code == 200
-        data = response.json()
-        assert "id" in data
-        assert data["file_type"] == "application/pdf"
-    finally:
-        # Clean up the temporary file
-        os.unlink(temp_pdf_path)
-
-def test_resume_evaluation(client, test_user, test_resume, test_job):
-    # Get token
-    response = client.post(
-        "/auth/token",
+    assert response.status_code == 200
+    data = response.json()
+    assert "id" in data
+    assert data["file_type"] == "application/pdf"
+    assert os.path.dirname(data["file_path"]) == str(tmp_path)
+
+@pytest.mark.asyncio
+async def test_resume_upload_large(client, auth_headers, test_job, tmp_path, monkeypatch, unique_suffix):
+    monkeypatch.setattr(save_file, "UPLOAD_DIR", str(tmp_path))
+    # Over the spool limit, so the upload reaches save_resume on disk
+    content = os.urandom(2 * 1024 * 1024)
+    sendfile_calls = []
+    real_sendfile = os.sendfile
+
+    def spy_sendfile(*args):
+        sendfile_calls.append(args)
+        return real_sendfile(*args)
+
+    monkeypatch.setattr(os, "sendfile", spy_sendfile)
+    response = await client.post(
+        "/resumes/",
+        files={"file": ("resume.txt", io.BytesIO(content), "text/plain")},
         data={
-            "username": test_user.email,
-            "password": "testpassword"
-        }
+            "job_id": test_job.id,
+            "name": "Test Applicant",
+            "email": f"applicant{unique_suffix()}@example.com",
+            "phone": "1234567890"
+        },
+        headers=auth_headers
     )
-    token = response.json()["access_token"]
+    assert response.status_code == 200
+    data = response.json()
+    assert sendfile_calls
+    assert data["file_size"] == len(content)
+    with open(data["file_path"], "rb") as saved:
+        assert saved.read() == content
 
+@pytest.mark.asyncio
+async def test_resume_evaluation(client, auth_headers, test_resume, test_job):
     # Create evaluation using the matching endpoint
-    response = client.post(
+    response = await client.post(
         f"/matching/evaluate/{test_job.id}/{test_resume.id}",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=auth_headers
     )
     assert response.status_code == 201  # Changed to 201 since it's a creation endpoint
     data = response.json()
@@ -190,23 +207,67 @@ def test_resume_evaluation(client, test_user, test_resume, test_job):
     assert 0 <= data["experience_match"] <= 1
     assert isinstance(data["matching_skills"], list)
 
-def test_analytics_endpoint(client, test_user, test_job, test_applicant, test_evaluation):
-    # Get token
-    response = client.post(
-        "/auth/token",
-        data={
-            "username": test_user.email,
-            "password": "testpassword"
-        }
+@pytest.mark.asyncio
+async def test_duplicate_screening(client, auth_headers, test_evaluation):
+    response = await client.post(
+        "/screening/",
+        json={
+            "resume_id": test_evaluation.resume_id,
+            "job_id": test_evaluation.job_id,
+            "overall_score": 0.8,
+            "semantic_score": 0.7,
+            "skills_score": 0.9,
+            "matching_skills": ["Python"]
+        },
+        headers=auth_headers
     )
-    token = response.json()["access_token"]
+    assert response.status_code == 409
+    assert response.json()["detail"]["code"] == "DUPLICATE_SCREENING"
 
-    # Get analytics
-    response = client.get(
-        "/analytics/dashboard",
-        headers={"Authorization": f"Bearer {token}"}
-    )
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/screening/job/{job_id}", "/jobs/{job_id}/evaluations"])
+async def test_evaluations_by_job_query_count(path, client, auth_headers, db_session, test_user, test_job, make_resume, query_counter):
+    # Two evaluations on different resumes, so a per-row lazy load would show up
+    now = datetime.utcnow()
+    for score in (85.0, 70.0):
+        # updated_at is only set on update, but ResumeResponse requires it
+        resume = make_resume(file_path=f"resume_{int(score)}.pdf", updated_at=now)
+        db_session.add(CandidateEvaluation(
+            resume_id=resume.id,
+            job_id=test_job.id,
+            admin_id=test_user.id,
+            overall_score=score,
+            skill_match=75.0,
+            experience_match=60.0,
+            matching_skills=["Python"],
+            status="Pending"
+        ))
+    db_session.flush()
+    job_id = test_job.id
+    # Start from an empty identity map so resumes can only come from SQL
+    db_session.expunge_all()
+
+    with query_counter() as queries:
+        response = await client.get(path.format(job_id=job_id), headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
+    assert len(data) == 2
+    assert all(result["resume"]["id"] == result["resume_id"] for result in data)
+    # The authenticated user, the job, and the evaluations joined with their resumes
+    assert len(queries) == 3
+
+@pytest.mark.asyncio
+async def test_analytics_endpoint(client, auth_headers, test_job, test_applicant, test_evaluation):
+    # The analytics reads are independent, so issue them concurrently
+    dashboard, skills, hiring, departments = await asyncio.gather(
+        client.get("/analytics/dashboard", headers=auth_headers),
+        client.get("/analytics/skills", headers=auth_headers),
+        client.get("/analytics/hiring", headers=auth_headers),
+        client.get("/analytics/departments", headers=auth_headers)
+    )
+    for response in (dashboard, skills, hiring, departments):
+        assert response.status_code == 200
+    data = dashboard.json()
     assert isinstance(data, dict)
-    assert len(data) > 0  # Should have some data 
\ No newline at end of file
+    assert len(data) > 0  # Should have some data
+    assert any(d["department"] == test_job.department for d in departments.json())
@@ -1,29 +1,36 @@
 import pytest
 from fastapi import HTTPException
+from jose import jwt
 from datetime import timedelta
-import uuid
+from app import auth
 from app.auth import (
     verify_password,
     get_password_hash,
     authenticate_user,
     create_access_token,
-    get_current_user
+    decode_access_token,
+    get_current_user,
+    SECRET_KEY,
+    ALGORITHM
 )
 from app.models import User
 from app.schemas import TokenData
 
-def test_verify_password():
-    password = "testpassword123!"
-    hashed_password = get_password_hash(password)
-    assert verify_password(password, hashed_password) is True
-    assert verify_password("wrongpassword", hashed_password) is False
+TEST_PASSWORD = "testpassword123!"
 
-def test_get_password_hash():
-    password = "testpassword123!"
-    hashed_password = get_password_hash(password)
-    assert hashed_password is not None
-    assert hashed_password != password
-    assert len(hashed_password) > 0
+@pytest.fixture(scope="session")
+def cached_hash():
+    """Hash the test password once per session"""
+    return get_password_hash(TEST_PASSWORD)
+
+def test_verify_password(cached_hash):
+    assert verify_password(TEST_PASSWORD, cached_hash) is True
+    assert verify_password("wrongpassword", cached_hash) is False
+
+def test_get_password_hash(cached_hash):
+    assert cached_hash is not None
+    assert cached_hash != TEST_PASSWORD
+    assert len(cached_hash) > 0
 
 def test_authenticate_user_success(db_session, test_user):
     authenticated_user = authenticate_user(
@@ -43,8 +50,8 @@ def test_authenticate_user_wrong_password(db_session, test_user):
     )
     assert authenticated_user is None
 
-def test_authenticate_user_nonexistent(db_session):
-    unique_id = str(uuid.uuid4())
+def test_authenticate_user_nonexistent(db_session, unique_suffix):
+    unique_id = unique_suffix()
     authenticated_user = authenticate_user(
         db_session,
         email=f"nonexistent{unique_id}@example.com",
@@ -65,40 +72,58 @@ def test_create_access_token_with_expiry():
     assert token is not None
     assert len(token) > 0
 
-@pytest.mark.asyncio
-async def test_get_current_user_valid_token(db_session, test_user):
-    token = create_access_token({"sub": test_user.email})
-    user = await get_current_user(token, db_session)
+def test_decode_access_token_reuses_verified_payload(valid_token, monkeypatch):
+    monkeypatch.setattr(auth, "_token_cache", {})
+    decode_calls = []
+    real_decode = auth.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        decode_calls.append(args)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    payload = decode_access_token(valid_token)
+    assert payload["sub"]
+    # Callers get their own copy, so changing it leaves the cache intact
+    payload["sub"] = "someone-else@example.com"
+    assert decode_access_token(valid_token)["sub"] != payload["sub"]
+    assert len(decode_calls) == 1
+
+def test_get_current_user_valid_token(db_session, test_user, valid_token):
+    user = get_current_user(valid_token, db_session)
     assert user is not None
     assert user.id == test_user.id
     assert user.email == test_user.email
 
-@pytest.mark.asyncio
-async def test_get_current_user_invalid_token(db_session):
+def test_get_current_user_invalid_token(db_session):
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_user("invalid_token", db_session)
+        get_current_user("invalid_token", db_session)
     assert exc_info.value.status_code == 401
 
-@pytest.mark.asyncio
-async def test_get_current_user_expired_token(db_session, test_user):
+def test_get_current_user_expired_token(db_session, test_user):
     # Create an expired token
     data = {"sub": test_user.email}
     expires_delta = timedelta(minutes=-1)  # Negative delta to create expired token
     token = create_access_token(data, expires_delta)
     
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_user(token, db_session)
+        get_current_user(token, db_session)
+    assert exc_info.value.status_code == 401
+
+def test_get_current_user_token_without_expiry(db_session, test_user):
+    token = jwt.encode({"sub": test_user.email}, SECRET_KEY, algorithm=ALGORITHM)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(token, db_session)
     assert exc_info.value.status_code == 401
 
-@pytest.mark.asyncio
-async def test_get_current_user_inactive_user(db_session, test_user):
+def test_get_current_user_inactive_user(db_session, test_user, valid_token):
     # Make user inactive
     test_user.is_active = False
     db_session.commit()
     
-    token = create_access_token({"sub": test_user.email})
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_user(token, db_session)
+        get_current_user(valid_token, db_session)
     assert exc_info.value.status_code == 401
     
     # Reset user state
@@ -1,11 +1,10 @@
 import pytest
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
-import uuid
 from app.models import User, Job, Applicant, Resume, CandidateEvaluation
 
-def test_user_creation(db_session):
-    unique_id = str(uuid.uuid4())
+def test_user_creation(db_session, unique_suffix):
+    unique_id = unique_suffix()
     user = User(
         email=f"newuser{unique_id}@example.com",
         name="New User",
@@ -14,7 +13,7 @@ def test_user_creation(db_session):
         role="user"
     )
     db_session.add(user)
-    db_session.commit()
+    db_session.flush()
     
     retrieved_user = db_session.query(User).filter_by(email=user.email).first()
     assert retrieved_user is not None
@@ -32,24 +31,10 @@ def test_user_unique_email_constraint(db_session, test_user):
             role="user"
         )
         db_session.add(duplicate_user)
-        db_session.commit()
+        db_session.flush()
 
-def test_job_creation(db_session, test_user):
-    job = Job(
-        admin_id=test_user.id,
-        title="New Job",
-        description="New Job Description",
-        requirements=["Python", "FastAPI"],
-        department="Engineering",
-        location="Remote",
-        salary_range={"min": 50000, "max": 100000},
-        job_type="Full-time",
-        experience_required=3.0,
-        skills_required=["Python", "FastAPI"],
-        status="Open"
-    )
-    db_session.add(job)
-    db_session.commit()
+def test_job_creation(db_session, test_user, make_job):
+    make_job(title="New Job", description="New Job Description")
     
     retrieved_job = db_session.query(Job).filter_by(title="New Job").first()
     assert retrieved_job is not None
@@ -57,17 +42,12 @@ def test_job_creation(db_session, test_user):
     assert retrieved_job.department == "Engineering"
     assert retrieved_job.status == "Open"
 
-def test_applicant_creation(db_session):
-    unique_id = str(uuid.uuid4())
-    applicant = Applicant(
+def test_applicant_creation(db_session, make_applicant, unique_suffix):
+    unique_id = unique_suffix()
+    applicant = make_applicant(
         name="New Applicant",
-        email=f"newapplicant{unique_id}@example.com",
-        phone="1234567890",
-        skills=["Python", "FastAPI"],
-        total_experience=3.0
+        email=f"newapplicant{unique_id}@example.com"
     )
-    db_session.add(applicant)
-    db_session.commit()
     
     retrieved_applicant = db_session.query(Applicant).filter_by(email=applicant.email).first()
     assert retrieved_applicant is not None
@@ -85,7 +65,7 @@ def test_resume_creation(db_session, test_applicant, test_job):
         file_size=2048
     )
     db_session.add(resume)
-    db_session.commit()
+    db_session.flush()
     
     retrieved_resume = db_session.query(Resume).filter_by(file_path="new.pdf").first()
     assert retrieved_resume is not None
@@ -105,7 +85,7 @@ def test_evaluation_creation(db_session, test_resume, test_job, test_user):
         status="Shortlisted"
     )
     db_session.add(evaluation)
-    db_session.commit()
+    db_session.flush()
     
     retrieved_evaluation = db_session.query(CandidateEvaluation).filter_by(resume_id=test_resume.id).first()
     assert retrieved_evaluation is not None
@@ -113,22 +93,9 @@ def test_evaluation_creation(db_session, test_resume, test_job, test_user):
     assert retrieved_evaluation.status == "Shortlisted"
     assert "Python" in retrieved_evaluation.matching_skills
 
-def test_cascade_delete(db_session, test_user):
+def test_cascade_delete(db_session, test_user, make_job):
     # Create a job for the user
-    job = Job(
-        admin_id=test_user.id,
-        title="Test Job for Cascade",
-        description="Test Description",
-        requirements=["Python"],
-        department="Engineering",
-        location="Remote",
-        salary_range={"min": 50000, "max": 100000},
-        job_type="Full-time",
-        experience_required=3.0,
-        skills_required=["Python"],
-        status="Open"
-    )
-    db_session.add(job)
+    make_job(title="Test Job for Cascade")
     db_session.commit()
     
     # Delete the user
@@ -151,4 +118,18 @@ def test_foreign_key_constraint(db_session):
             file_size=1024
         )
         db_session.add(resume)
-        db_session.commit() 
\ No newline at end of file
+        db_session.flush()
+
+def test_fresh_schema_rebuilds_tables(db_session, test_user, fresh_schema):
+    # test_user was created before the rebuild, so the new tables are empty
+    assert db_session.query(User).count() == 0
+    user = User(
+        email=test_user.email,
+        name="Rebuilt User",
+        hashed_password="hashed_password",
+        is_active=True,
+        role="user"
+    )
+    db_session.add(user)
+    db_session.flush()
+    assert db_session.query(User).count() == 1
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import pytest
+from fastapi import HTTPException
+from starlette.datastructures import UploadFile
+from app.services import save_file
+
+LARGE_CONTENT = b"x" * (save_file.SENDFILE_MIN_SIZE + 1)
+
+def make_upload(content, filename="resume.txt"):
+    spooled = tempfile.SpooledTemporaryFile(max_size=save_file.SENDFILE_MIN_SIZE)
+    spooled.write(content)
+    spooled.seek(0)
+    return UploadFile(filename=filename, file=spooled)
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(save_file, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+def test_save_resume_falls_back_when_sendfile_fails(upload_dir, monkeypatch):
+    def failing_sendfile(*args):
+        raise OSError("sendfile needs a socket")
+
+    monkeypatch.setattr(os, "sendfile", failing_sendfile)
+    file_path = save_file.save_resume(make_upload(LARGE_CONTENT))
+    with open(file_path, "rb") as saved:
+        assert saved.read() == LARGE_CONTENT
+
+def test_save_resume_removes_partial_file_on_failure(upload_dir, monkeypatch):
+    def failing_copy(src, fd, size):
+        os.write(fd, b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(save_file, "_copy_to_fd", failing_copy)
+    with pytest.raises(HTTPException) as exc_info:
+        save_file.save_resume(make_upload(b"content"))
+    assert exc_info.value.status_code == 500
+    assert list(upload_dir.iterdir()) == []
+
+def test_save_resume_rejects_truncated_sendfile(upload_dir, monkeypatch):
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0)
+    with pytest.raises(HTTPException) as exc_info:
+        save_file.save_resume(make_upload(LARGE_CONTENT))
+    assert exc_info.value.status_code == 500
+    assert list(upload_dir.iterdir()) == []